@@ -1,27 +1,62 @@
-from pywrstat.client import Pywrstat
-from pywrstat.errors import (
-    CommandFailed,
-    Error,
-    NotReady,
-    SetupFailed,
-    Timeout,
-    Unreachable,
-)
-from pywrstat.schema import (
-    DaemonConfiguration,
-    Events,
-    LowBatteryAction,
-    PowerEvent,
-    PowerFailureAction,
-    ReachabilityChangedEvent,
-    TestResult,
-    TestStatus,
-    UPSProperties,
-    UPSStatus,
-    ValueChangedEvent,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from pywrstat.version import __version__  # noqa
 
+if TYPE_CHECKING:
+    from pywrstat.client import Pywrstat  # noqa: F401
+    from pywrstat.errors import (  # noqa: F401
+        CommandFailed,
+        Error,
+        NotReady,
+        SetupFailed,
+        Timeout,
+        Unreachable,
+    )
+    from pywrstat.schema import (  # noqa: F401
+        DaemonConfiguration,
+        Events,
+        LowBatteryAction,
+        PowerEvent,
+        PowerFailureAction,
+        ReachabilityChangedEvent,
+        TestResult,
+        TestStatus,
+        UPSProperties,
+        UPSStatus,
+        ValueChangedEvent,
+    )
+
+_SUBMODULE_ATTRS = {
+    "pywrstat.client": ["Pywrstat"],
+    "pywrstat.errors": [
+        "CommandFailed",
+        "Error",
+        "NotReady",
+        "SetupFailed",
+        "Timeout",
+        "Unreachable",
+    ],
+    "pywrstat.schema": [
+        "DaemonConfiguration",
+        "Events",
+        "LowBatteryAction",
+        "PowerEvent",
+        "PowerFailureAction",
+        "ReachabilityChangedEvent",
+        "TestResult",
+        "TestStatus",
+        "UPSProperties",
+        "UPSStatus",
+        "ValueChangedEvent",
+    ],
+}
+_ATTR_TO_MODULE = {
+    attr: module_name
+    for module_name, attrs in _SUBMODULE_ATTRS.items()
+    for attr in attrs
+}
+
 __all__ = [
     "CommandFailed",
     "DaemonConfiguration",
@@ -42,3 +77,16 @@ __all__ = [
     "Unreachable",
     "ValueChangedEvent",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,19 +1,12 @@
-import pwd
-import secrets
-import subprocess
+import os
 import sys
-import uuid
 from argparse import ArgumentParser, Namespace
+from functools import partial
 from pathlib import Path
-from textwrap import dedent
-
-import jwt
-from dotenv import dotenv_values
 
 from pywrstat.client import Pywrstat
 from pywrstat.constants import DEFAULT_PWRSTAT_PATH
 from pywrstat.schema import BaseModel
-from pywrstat.web import JwtPayload
 
 PYWRSTAT_WEB_SERVICE_SYSTEMD_SERVICE_NAME = "pywrstat-web.service"
 PYWRSTAT_WEB_DEFAULT_USER = "pywrstat_web"
@@ -31,18 +24,39 @@ After=network.target
 type=Simple
 User={username}
 EnvironmentFile={env_file_path}
-ExecStart={python_executable_path} -m gunicorn -w 2 -b {host}:{port} {gunicorn_extra_args} 'pywrstat.web:create_app()'
+ExecStart={python_executable_path} -m gunicorn -c python:pywrstat.gunicorn_conf --workers 1 --threads 8 --timeout 0 -b {host}:{port} {gunicorn_extra_args} 'pywrstat.web:create_app()'
 
 [Install]
 WantedBy=multi-user.target
 """
+_render_systemd_web_service = partial(
+    SYSTEMD_WEB_SERVICE_TEMPLATE.format,
+    python_executable_path=sys.executable,
+    env_file_path=PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH,
+)
+MODES_WITHOUT_ARGUMENTS = (
+    "ups.status",
+    "ups.properties",
+    "daemon.configuration",
+    "web.api_key.get",
+)
+WEB_SERVICE_ENV_FILE_TEMPLATE = """\
+PYWRSTAT_WEB_SECRET_KEY="{secret_key}"
+PYWRSTAT_WEB_JWT_SECRET_KEY="{jwt_secret_key}"
+PYWRSTAT_PWRSTAT_EXECUTABLE_PATH="{pwrstat_path}"
+PYWRSTAT_RUN_PWRSTAT_WITH_SUDO={sudo_pwrstat}
+"""
 
 
-def sh(command: str):
-    subprocess.run(command, shell=True, check=True)
+def sh(*argv: str):
+    import subprocess
+
+    subprocess.run(argv, check=True)
 
 
 def user_exists(user_name: str) -> bool:
+    import pwd
+
     try:
         pwd.getpwnam(user_name)
         return True
@@ -51,7 +65,7 @@ def user_exists(user_name: str) -> bool:
 
 
 def create_user(user_name: str):
-    sh(f"useradd -m {user_name}")
+    sh("useradd", "-m", user_name)
 
 
 def parse_bind_host_port(bind_expr: str) -> tuple[str, int]:
@@ -60,12 +74,31 @@ def parse_bind_host_port(bind_expr: str) -> tuple[str, int]:
     return host, int(raw_port)
 
 
-def get_server_jwt_key() -> str | None:
+def _read_env_vars(env_file_path: Path) -> dict[str, str]:
+    env_vars = {}
+    for line in env_file_path.read_text().splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            env_vars[key.strip()] = value.strip().strip('"')
+    return env_vars
+
+
+def get_server_keys() -> tuple[str | None, str | None]:
     try:
-        conf = dotenv_values(PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH)
-        return conf["PYWRSTAT_WEB_JWT_SECRET_KEY"]
-    except Exception:
-        return None
+        env_vars = _read_env_vars(PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH)
+    except OSError:
+        return None, None
+    return (
+        env_vars.get("PYWRSTAT_WEB_SECRET_KEY"),
+        env_vars.get("PYWRSTAT_WEB_JWT_SECRET_KEY"),
+    )
+
+
+def write_file(path: Path, content: str, mode: int = 0o644):
+    # Create the file with its final mode in a single open
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    with os.fdopen(fd, "w") as f:
+        f.write(content)
 
 
 def print_pydantic_json(data: BaseModel):
@@ -73,72 +106,81 @@ def print_pydantic_json(data: BaseModel):
 
 
 def web_systemctl_install_mode(args: Namespace):
+    import secrets
+
     username = args.user
     if not user_exists(username):
         print(f"User '{username}' does not exist, creating")
         create_user(username)
-    PYWRSTAT_WEB_SERVICE_CONF_DIR.mkdir(mode=0o600, parents=True, exist_ok=True)
+    PYWRSTAT_WEB_SERVICE_CONF_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    secret_key, jwt_secret_key = get_server_keys()
     print(f"Writing server environment file at: {PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH}")
-    PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH.touch(mode=0o600)
-    PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH.write_text(
-        dedent(
-            f"""\
-    PYWRSTAT_WEB_SECRET_KEY="{secrets.token_hex(128)}"
-    PYWRSTAT_WEB_JWT_SECRET_KEY="{get_server_jwt_key() or secrets.token_hex(128)}"
-    PYWRSTAT_PWRSTAT_EXECUTABLE_PATH="{args.pwrstat_path}"
-    PYWRSTAT_RUN_PWRSTAT_WITH_SUDO={int(args.sudo_pwrstat)}
-    """
-        )
+    write_file(
+        PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH,
+        WEB_SERVICE_ENV_FILE_TEMPLATE.format(
+            secret_key=secret_key or secrets.token_hex(32),
+            jwt_secret_key=jwt_secret_key or secrets.token_hex(32),
+            pwrstat_path=args.pwrstat_path,
+            sudo_pwrstat=int(args.sudo_pwrstat),
+        ),
+        mode=0o600,
     )
     gunicorn_extra_args = None
     if args.certfile and args.keyfile:
         gunicorn_extra_args = f"--certfile={args.certfile} --keyfile={args.keyfile}"
     service_already_exists = SYSTEMD_WEB_SERVICE_FILE_PATH.exists()
     service_host, service_port = args.bind
-    SYSTEMD_WEB_SERVICE_FILE_PATH.write_text(
-        SYSTEMD_WEB_SERVICE_TEMPLATE.format(
-            python_executable_path=sys.executable,
-            env_file_path=PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH,
+    write_file(
+        SYSTEMD_WEB_SERVICE_FILE_PATH,
+        _render_systemd_web_service(
             username=username,
             host=service_host,
             port=service_port,
             gunicorn_extra_args=gunicorn_extra_args or "",
-        )
+        ),
     )
     if args.edit_sudoers and args.user != "root":
         sudoers_file_path = Path("/etc/sudoers")
         sudoers_entry = f"{username} ALL=(root) NOPASSWD: /usr/sbin/pwrstat *"
-        sudoers = sudoers_file_path.read_text().strip()
-        if sudoers_entry not in sudoers:
+        with sudoers_file_path.open() as sudoers_file:
+            present = any(line.strip() == sudoers_entry for line in sudoers_file)
+        if not present:
             print(f"Allowing user '{username}' to run pwrstat as 'root' (via sudoers)")
-            sudoers_file_path.write_text(f"{sudoers}\n{sudoers_entry}\n")
+            with sudoers_file_path.open("a") as sudoers_file:
+                sudoers_file.write(f"\n{sudoers_entry}\n")
     if service_already_exists:
-        sh("systemctl daemon-reload")
+        sh("systemctl", "daemon-reload")
     if args.enable_service:
-        sh(f"systemctl enable {PYWRSTAT_WEB_SERVICE_SYSTEMD_SERVICE_NAME}")
+        sh("systemctl", "enable", PYWRSTAT_WEB_SERVICE_SYSTEMD_SERVICE_NAME)
     if args.start_service:
-        sh(f"systemctl restart {PYWRSTAT_WEB_SERVICE_SYSTEMD_SERVICE_NAME}")
+        # Last step of the installation: hand the process over to systemctl
+        # (exec does not flush Python's stdio buffers)
+        sys.stdout.flush()
+        os.execvp(
+            "systemctl",
+            ["systemctl", "restart", PYWRSTAT_WEB_SERVICE_SYSTEMD_SERVICE_NAME],
+        )
 
 
 def web_api_key_get_mode():
-    conf = dotenv_values(PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH)
-    jwt_secret_key = conf["PYWRSTAT_WEB_JWT_SECRET_KEY"]
+    import uuid
+
+    import jwt
+
+    from pywrstat.web import JwtPayload
+
+    _, jwt_secret_key = get_server_keys()
+    if jwt_secret_key is None:
+        sys.exit(f"No JWT secret key found in {PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH}")
     api_key = jwt.encode(JwtPayload(jti=str(uuid.uuid4())).model_dump(), jwt_secret_key)
     print(api_key)
 
 
-def create_argument_parser():
-    parser = ArgumentParser(description="Pywrstat command line interface")
-    sub_parsers = parser.add_subparsers(description="Mode", dest="mode", required=True)
-    sub_parsers.add_parser("ups.status")
-    sub_parsers.add_parser("ups.properties")
-    sub_parsers.add_parser("daemon.configuration")
-    sub_parsers.add_parser("web.api_key.get")
-    web_systemctl_install_parser = sub_parsers.add_parser("web.systemctl.install")
+def add_web_systemctl_install_arguments(web_systemctl_install_parser: ArgumentParser):
     web_systemctl_install_parser.add_argument(
         "--bind",
         type=parse_bind_host_port,
-        default=":8000",
+        default=("0.0.0.0", 8000),
         help="Bind the pywrstat web server to <address>:<port> (default: 0.0.0.0:8000)",
     )
     web_systemctl_install_parser.add_argument(
@@ -186,19 +228,31 @@ def create_argument_parser():
         default=True,
         help="Don't automatically start the pywrstat web server on system startup",
     )
+
+
+def create_argument_parser(mode: str | None = None):
+    parser = ArgumentParser(description="Pywrstat command line interface")
+    sub_parsers = parser.add_subparsers(description="Mode", dest="mode", required=True)
+    for mode_without_arguments in MODES_WITHOUT_ARGUMENTS:
+        sub_parsers.add_parser(mode_without_arguments)
+    web_systemctl_install_parser = sub_parsers.add_parser("web.systemctl.install")
+    # Skip the install arguments only when another known mode is selected (so that
+    # help and error messages for unknown or missing modes stay complete)
+    if mode not in MODES_WITHOUT_ARGUMENTS:
+        add_web_systemctl_install_arguments(web_systemctl_install_parser)
     return parser
 
 
 def main():
-    args = create_argument_parser().parse_args()
+    argv = sys.argv[1:]
+    args = create_argument_parser(mode=argv[0] if argv else None).parse_args(argv)
     mode = args.mode
-    pywrstat_client = Pywrstat()
     if mode == "ups.status":
-        return print_pydantic_json(pywrstat_client.get_ups_status())
+        return print_pydantic_json(Pywrstat().get_ups_status())
     if mode == "ups.properties":
-        return print_pydantic_json(pywrstat_client.get_ups_properties())
+        return print_pydantic_json(Pywrstat().get_ups_properties())
     if mode == "daemon.configuration":
-        return print_pydantic_json(pywrstat_client.get_daemon_configuration())
+        return print_pydantic_json(Pywrstat().get_daemon_configuration())
     if mode == "web.systemctl.install":
         return web_systemctl_install_mode(args)
     if mode == "web.api_key.get":
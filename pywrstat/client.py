@@ -1,12 +1,21 @@
 import json
 import re
+import sys
 import time
-from collections import defaultdict
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Generator, Optional, Union
-
-from dateutil.parser import parse as parse_time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from pywrstat.errors import CommandFailed, NotReady, SetupFailed, Timeout, Unreachable
 from pywrstat.reader import Reader, ReaderBase
@@ -34,29 +43,65 @@ _PywrstatParsedOutputType = Dict[
 
 PropertyBag = Dict[str, str]
 
+_TIMESTAMP_FORMAT = "%Y/%m/%d %H:%M:%S"
+_TEST_RESULT_RE = re.compile(
+    r"^([^\s]+)\s+at\s+(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})$"
+)
+_POWER_EVENT_RE = re.compile(
+    r"^([\w\s]+)\s+at\s+(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})\s+for\s+(\d+) (sec|min)\.$"
+)
+_MAX_INTERNED_VALUE_LENGTH = 24
+_PWRSTAT_VERSION_RE = re.compile(r"^pwrstat version (\d+\.\d+\.\d+)$")
+
 
-def _parse_pwrstat_output(output: str) -> _PywrstatParsedOutputType:
+def _parse_pwrstat_output(
+    output: Union[str, Iterable[str]]
+) -> _PywrstatParsedOutputType:
+    if isinstance(output, str):
+        output = output.splitlines(keepends=False)
     current_section: Optional[str] = None
-    parsed_output: _PywrstatParsedOutputType = defaultdict(dict)
-    for line in output.splitlines(keepends=False):
-        match = re.search(r"^\s*([^:]+):$", line)
-        if match:
-            current_section = match.group(1)
+    current_properties: Optional[Dict[str, str]] = None
+    parsed_output: _PywrstatParsedOutputType = {}
+    for line in output:
+        line = line.lstrip()
+        # Section header, example: "Current UPS status:"
+        if line.endswith(":") and len(line) > 1 and ":" not in line[:-1]:
+            current_section = sys.intern(line[:-1])
+            current_properties = None
+            continue
+        # Property, example: "Battery Capacity............. 100 %"
+        key_end = line.find(".")
+        if key_end <= 0:
             continue
-        match = re.search(r"^\s*([^.]+)\.+\s+(.+)$", line)
-        if match:
+        value = line[key_end:].lstrip(".")
+        if len(value) < 2 or not value[0].isspace():
+            continue
+        if current_properties is None:
+            # Sections are only reported once they have properties
             assert current_section
-            current_prop = match.group(1).strip()
-            current_value = match.group(2).strip()
-            parsed_output[current_section][current_prop] = current_value
+            current_properties = parsed_output.setdefault(current_section, {})
+        # Keys and most values (On/Off, Normal, ...) come from a small fixed vocabulary
+        value = value.strip()
+        if len(value) <= _MAX_INTERNED_VALUE_LENGTH:
+            value = sys.intern(value)
+        current_properties[sys.intern(line[:key_end].strip())] = value
     return parsed_output
 
 
+def _first_int(raw_value: str) -> int:
+    return int(raw_value.partition(" ")[0])
+
+
+def _first_float(raw_value: str) -> float:
+    return float(raw_value.partition(" ")[0])
+
+
 def _parse_load_percent(raw_load: str) -> float:
-    match = re.search(r"^\d+\s*Watt\((\d+)\s*%\)$", raw_load)
-    if not match:
-        raise ValueError(f"could not parse load (%) from '{raw_load}'")
-    return float(match.group(1)) / 100.0
+    # Expected format: "<watts> Watt(<percent> %)"
+    try:
+        return int(raw_load.split("(", 1)[1].split("%", 1)[0]) / 100.0
+    except (IndexError, ValueError):
+        raise ValueError(f"could not parse load (%) from '{raw_load}'") from None
 
 
 def _parse_test_result(raw_test_result: str) -> Optional[TestResult]:
@@ -65,30 +110,25 @@ def _parse_test_result(raw_test_result: str) -> Optional[TestResult]:
         return None
     if raw_test_result == "In progress":
         return TestResult(status=TestStatus.InProgress, test_time=None)
-    match = re.search(
-        r"^([^\s]+)\s+at\s+(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})$", raw_test_result
-    )
+    match = _TEST_RESULT_RE.match(raw_test_result)
     if match:
         return TestResult(
             status=(
                 TestStatus.Passed if match.group(1) == "Passed" else TestStatus.Failed
             ),
-            test_time=parse_time(match.group(2)),
+            test_time=datetime.strptime(match.group(2), _TIMESTAMP_FORMAT),
         )
     return None
 
 
 def _parse_power_event(raw_power_event: str) -> Optional[PowerEvent]:
-    match = re.search(
-        r"^([\w\s]+)\s+at\s+(\d{4}/\d{2}/\d{2}\s+\d{2}:\d{2}:\d{2})\s+for\s+(\d+) (sec|min)\.$",
-        raw_power_event,
-    )
+    match = _POWER_EVENT_RE.match(raw_power_event)
     if match:
         unit = match.group(4)
         multiplier = 1 if unit == "sec" else 60
         return PowerEvent(
             event_type=match.group(1),
-            event_time=parse_time(match.group(2)),
+            event_time=datetime.strptime(match.group(2), _TIMESTAMP_FORMAT),
             duration=timedelta(seconds=(int(match.group(3)) * multiplier)),
         )
     return None
@@ -99,23 +139,29 @@ def _is_ups_reachable(raw_ups_status: PropertyBag) -> bool:
 
 
 def _check_percent(value: float) -> float:
-    if not isinstance(value, float) or value < 0.0 or value > 1.0:
+    # bool is an int subclass, True must not silently mean 100%. The range check
+    # also rejects NaN (all comparisons with NaN are false)
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, (int, float))
+        or not 0.0 <= value <= 1.0
+    ):
         raise ValueError(
-            f"percent should be a float value between 0.0 and 1.0 (inclusive),"
+            f"percent should be a value between 0.0 and 1.0 (inclusive),"
             f" not '{value}' ({type(value).__name__})"
         )
-    return value
+    return float(value)
 
 
 def _parse_power_failure_action(data: PropertyBag) -> PowerFailureAction:
     return PowerFailureAction(
         delay_time_since_power_failure=timedelta(
-            seconds=int(data["Delay time since Power failure"].split()[0])
+            seconds=_first_int(data["Delay time since Power failure"])
         ),
         script_command_enabled=_parse_on_off(data["Run script command"]),
         script_command_path=Path(data["Path of script command"]),
         script_command_duration=timedelta(
-            seconds=int(data["Duration of command running"].split()[0])
+            seconds=_first_int(data["Duration of command running"])
         ),
         system_shutdown_enabled=_parse_on_off(data["Enable shutdown system"]),
     )
@@ -124,32 +170,94 @@ def _parse_power_failure_action(data: PropertyBag) -> PowerFailureAction:
 def _parse_low_battery_action(data: PropertyBag) -> LowBatteryAction:
     return LowBatteryAction(
         remaining_runtime_threshold=timedelta(
-            seconds=int(data["Remaining runtime threshold"].split()[0])
+            seconds=_first_int(data["Remaining runtime threshold"])
         ),
-        battery_capacity_threshold_percent=float(
-            data["Battery capacity threshold"].split()[0]
+        battery_capacity_threshold_percent=_first_float(
+            data["Battery capacity threshold"]
         )
         / 100,
         script_command_enabled=_parse_on_off(data["Run script command"]),
         script_command_path=Path(data["Path of command"]),
         script_command_duration=timedelta(
-            seconds=int(data["Duration of command running"].split()[0])
+            seconds=_first_int(data["Duration of command running"])
         ),
         system_shutdown_enabled=_parse_on_off(data["Enable shutdown system"]),
     )
 
 
+def _parse_ups_status(data: PropertyBag) -> UPSStatus:
+    return UPSStatus(
+        state=data["State"],
+        power_supply_by=data["Power Supply by"],
+        utility_voltage_volts=_first_float(data["Utility Voltage"]),
+        output_voltage_volts=_first_float(data["Output Voltage"]),
+        battery_capacity_percent=_first_float(data["Battery Capacity"]) / 100.0,
+        remaining_runtime=timedelta(minutes=_first_int(data["Remaining Runtime"])),
+        load_watts=_first_float(data["Load"]),
+        load_percent=_parse_load_percent(data["Load"]),
+        line_interaction=data["Line Interaction"],
+        test_result=_parse_test_result(data["Test Result"]),
+        last_power_event=_parse_power_event(data["Last Power Event"]),
+    )
+
+
+def _parse_ups_properties(data: PropertyBag) -> UPSProperties:
+    return UPSProperties(
+        ups_model_name=data["Model Name"],
+        firmware_number=data["Firmware Number"],
+        rating_voltage_volts=_first_float(data["Rating Voltage"]),
+        rating_power_watts=_first_float(data["Rating Power"]),
+    )
+
+
+_ON_OFF_VALUES = {
+    "on": True,
+    "On": True,
+    "ON": True,
+    "off": False,
+    "Off": False,
+    "OFF": False,
+}
+
+
 def _parse_on_off(raw_value: str) -> bool:
-    return {"on": True, "off": False}[raw_value.lower()]
+    enabled = _ON_OFF_VALUES.get(raw_value)
+    if enabled is None:
+        enabled = _ON_OFF_VALUES[raw_value.lower()]
+    return enabled
 
 
 def _on_off(value: bool) -> str:
     return "on" if value else "off"
 
 
+def _seconds_arg(value: timedelta) -> str:
+    return str(int(value.total_seconds()))
+
+
+def _percent_arg(value: float) -> str:
+    return str(int(_check_percent(value) * 100.0))
+
+
 class Pywrstat(object):
-    def __init__(self, reader: Optional[ReaderBase] = None):
+    def __init__(
+        self,
+        reader: Optional[ReaderBase] = None,
+        cache_ttl: Optional[timedelta] = None,
+    ):
+        """Create a pwrstat client.
+        :param reader: Reader used to run pwrstat commands (runs the pwrstat binary by default).
+        :param cache_ttl: Reuse the output of `pwrstat -status` and `pwrstat -config` for this long instead of
+                          running pwrstat again. Caching is disabled by default. The cache is invalidated whenever
+                          the configuration is changed through this client.
+        """
         self._reader = reader or Reader()
+        self._cache_ttl_seconds = cache_ttl.total_seconds() if cache_ttl else None
+        self._cache: Dict[Tuple[str, ...], Tuple[float, Tuple[str, ...]]] = {}
+
+    def invalidate_cache(self) -> None:
+        """Discard cached pwrstat outputs (see `cache_ttl`)."""
+        self._cache.clear()
 
     def is_reachable(self) -> bool:
         """Check whether the UPS is reachable.
@@ -164,7 +272,7 @@ class Pywrstat(object):
         :return: pwrstat binary version (as returned by `pwrstat -version`).
         """
         for line in self._reader.read(["-version"]).splitlines(keepends=False):
-            match = re.search(r"^pwrstat version (\d+\.\d+\.\d+)$", line.strip())
+            match = _PWRSTAT_VERSION_RE.match(line.strip())
             if match:
                 return match.group(1)
         return None
@@ -175,7 +283,7 @@ class Pywrstat(object):
                  a mapping of sections (example "Action for Power Failure") to their respective configurations (which
                  is a mapping of properties to string values)
         """
-        return _parse_pwrstat_output(self._reader.read(["-config"]))
+        return _parse_pwrstat_output(self._read_lines(["-config"]))
 
     def get_daemon_configuration(self) -> DaemonConfiguration:
         """Get the pwrstatd (pwrstat daemon) configuration (as returned by `pwrstat -config`).
@@ -217,7 +325,7 @@ class Pywrstat(object):
                  (example "Current UPS status") to their respective configurations (which is a mapping of
                  properties to string values)
         """
-        data = _parse_pwrstat_output(self._reader.read(["-status"]))
+        data = _parse_pwrstat_output(self._read_lines(["-status"]))
         if check_reachable and not _is_ups_reachable(data["Current UPS status"]):
             raise Unreachable("UPS is not reachable")
         return data
@@ -236,22 +344,7 @@ class Pywrstat(object):
                  `UPSStatus` object.
         :raises: Unreachable: If the UPS is not reachable.
         """
-        data = self.get_raw_ups_status(check_reachable=True)
-        return UPSStatus(
-            state=data["State"],
-            power_supply_by=data["Power Supply by"],
-            utility_voltage_volts=float(data["Utility Voltage"].split()[0]),
-            output_voltage_volts=float(data["Output Voltage"].split()[0]),
-            battery_capacity_percent=float(data["Battery Capacity"].split()[0]) / 100.0,
-            remaining_runtime=timedelta(
-                minutes=int(data["Remaining Runtime"].split()[0])
-            ),
-            load_watts=float(data["Load"].split()[0]),
-            load_percent=_parse_load_percent(data["Load"]),
-            line_interaction=data["Line Interaction"],
-            test_result=_parse_test_result(data["Test Result"]),
-            last_power_event=_parse_power_event(data["Last Power Event"]),
-        )
+        return _parse_ups_status(self.get_raw_ups_status(check_reachable=True))
 
     def monitor_ups_status(
         self, poll_every: Optional[timedelta] = None
@@ -333,12 +426,18 @@ class Pywrstat(object):
                  `UPSProperties` object.
         :raises: Unreachable: If the UPS is not reachable.
         """
-        data = self.get_raw_ups_properties(check_reachable=True)
-        return UPSProperties(
-            ups_model_name=data["Model Name"],
-            firmware_number=data["Firmware Number"],
-            rating_voltage_volts=float(data["Rating Voltage"].split()[0]),
-            rating_power_watts=float(data["Rating Power"].split()[0]),
+        return _parse_ups_properties(self.get_raw_ups_properties(check_reachable=True))
+
+    def get_ups_snapshot(self) -> Tuple[UPSStatus, UPSProperties]:
+        """Get both the UPS status and properties from a single `pwrstat -status` call.
+        :return: The UPS status ("Current UPS status" section) and properties ("Properties" section), deserialized
+                 to `UPSStatus` and `UPSProperties` objects.
+        :raises: Unreachable: If the UPS is not reachable.
+        """
+        data = self.get_raw_complete_ups_status(check_reachable=True)
+        return (
+            _parse_ups_status(data["Current UPS status"]),
+            _parse_ups_properties(data["Properties"]),
         )
 
     def test_ups(
@@ -359,34 +458,34 @@ class Pywrstat(object):
         :raises: NotReady: If a test is already in progress.
         :raises: Timeout: If the tests did not complete after the specified timeout.
         """
-        previous_test_result = self.get_ups_status().test_result
+        previous_test_result = self._get_test_result()
         if (
             previous_test_result
             and previous_test_result.status == TestStatus.InProgress
         ):
             raise NotReady("A test is already in progress")
         data = self._reader.read(["-test"])
+        self.invalidate_cache()
         if "The UPS test is initiated" not in data:
             raise CommandFailed(data)
         if not poll_result:
             return None
-        cutoff = datetime.now() + timeout if timeout else None
-        poll_every = timedelta(seconds=1) if poll_every is None else poll_every
-        start_time = datetime.now()
+        poll_every_seconds = 1.0 if poll_every is None else poll_every.total_seconds()
+        start_time = time.monotonic()
+        deadline = start_time + timeout.total_seconds() if timeout else None
         while True:
-            last_result = self.get_ups_status().test_result
+            last_result = self._get_test_result()
             if last_result == previous_test_result:
                 pass
             elif last_result and last_result.status != TestStatus.InProgress:
                 return last_result
-            if cutoff and datetime.now() > cutoff:
-                now = datetime.now()
-                elapsed_seconds = (now - start_time).total_seconds()
+            if deadline is not None and time.monotonic() > deadline:
+                elapsed_seconds = time.monotonic() - start_time
                 raise Timeout(
                     f"Timed out waiting for tests results after {elapsed_seconds}s."
                     f" Last status was '{last_result.status.value if last_result else 'unknown'}'."
                 )
-            time.sleep(poll_every.total_seconds())
+            time.sleep(poll_every_seconds)
 
     def reset_daemon_configuration(self) -> None:
         """Reset all daemon configurations to default (as run by `pwrstat -reset`).
@@ -394,27 +493,28 @@ class Pywrstat(object):
         :raises: CommandFailed: If the daemon configuration could not be reset.
         """
         self._reader.read(["-reset"])
+        self.invalidate_cache()
 
     @property
     def hibernation_enabled(self) -> bool:
         """Check whether system hibernation (vs. system shutdown) is enabled.
         :return: `True` if hibernation is enabled, `False` otherwise.
         """
-        return self.get_daemon_configuration().hibernate_enabled
+        return self._get_daemon_flag("Hibernate")
 
     @hibernation_enabled.setter
     def hibernation_enabled(self, enabled: bool) -> None:
         """Set up the hibernation (vs. system shutdown) enablement (as run by `pwrstat -hibernate [on/off]`).
         :param enabled: Specify whether to enable or disable hibernation (vs. system shutdown).
         """
-        self._check_setup(self._reader.read(["-hibernate", _on_off(enabled)]))
+        self._setup(["-hibernate", _on_off(enabled)])
 
     @property
     def alarm_enabled(self) -> bool:
         """Check whether the UPS alarm is enabled.
         :return: `True` if the UPS alarm is enabled, `False` otherwise.
         """
-        return self.get_daemon_configuration().alarm_enabled
+        return self._get_daemon_flag("Alarm")
 
     @alarm_enabled.setter
     def alarm_enabled(self, enabled: bool) -> None:
@@ -422,14 +522,14 @@ class Pywrstat(object):
         :param enabled: Specify whether to enable or disable the UPS alarm.
         :raises: SetupFailed: If alarm enablement could not be setup.
         """
-        self._check_setup(self._reader.read(["-alarm", _on_off(enabled)]))
+        self._setup(["-alarm", _on_off(enabled)])
 
     def mute(self) -> None:
         """Setup temporally mute alarm when alarm is on enable state (as run by `pwrstat -mute`).
         :raises: Unreachable: If the UPS is not reachable.
         :raises: SetupFailed: If alarm enablement could not be muted.
         """
-        self._check_setup(self._reader.read(["-mute"]))
+        self._setup(["-mute"])
 
     def _configure_action(
         self,
@@ -442,22 +542,24 @@ class Pywrstat(object):
         duration: Optional[timedelta] = None,
         shutdown: Optional[bool] = None,
     ) -> None:
-        args = [action]
-        if delay is not None:
-            args += ["-delay", str(int(delay.total_seconds()))]
-        if runtime is not None:
-            args += ["-runtime", str(int(runtime.total_seconds()))]
-        if capacity is not None:
-            args += ["-capacity", str(int(_check_percent(capacity) * 100.0))]
-        if active is not None:
-            args += ["-active", _on_off(active)]
-        if cmd is not None:
-            args += ["-cmd", str(cmd)]
-        if duration is not None:
-            args += ["-duration", str(int(duration.total_seconds()))]
-        if shutdown is not None:
-            args += ["-shutdown", _on_off(shutdown)]
-        self._check_setup(self._reader.read(args))
+        spec: Tuple[Tuple[Any, str, Callable[[Any], str]], ...] = (
+            (delay, "-delay", _seconds_arg),
+            (runtime, "-runtime", _seconds_arg),
+            (capacity, "-capacity", _percent_arg),
+            (active, "-active", _on_off),
+            (cmd, "-cmd", str),
+            (duration, "-duration", _seconds_arg),
+            (shutdown, "-shutdown", _on_off),
+        )
+        args = [
+            action,
+            *chain.from_iterable(
+                (flag, to_arg(value))
+                for value, flag, to_arg in spec
+                if value is not None
+            ),
+        ]
+        self._setup(args)
 
     def configure_power_failure_action(
         self,
@@ -536,7 +638,7 @@ class Pywrstat(object):
             args += ["-account", account]
         if password is not None:
             args += ["-password", password]
-        self._check_setup(self._reader.read(args))
+        self._setup(args)
 
     def verify_cloud_configuration(self) -> bool:
         """Verify PowerPanel can log in to cloud server (as run by `pwrstat -verify`).
@@ -545,6 +647,32 @@ class Pywrstat(object):
         output = self._reader.read(["-verify"])
         return "Verify failed" not in output
 
+    def _get_daemon_flag(self, key: str) -> bool:
+        return _parse_on_off(
+            self.get_raw_daemon_configuration()["Daemon Configuration"][key]
+        )
+
+    def _get_test_result(self) -> Optional[TestResult]:
+        data = self.get_raw_ups_status(check_reachable=True)
+        return _parse_test_result(data["Test Result"])
+
+    def _read_lines(self, args: List[str]) -> Iterable[str]:
+        if self._cache_ttl_seconds is None:
+            return self._reader.iter_lines(args)
+        key = tuple(args)
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and now - cached[0] < self._cache_ttl_seconds:
+            return cached[1]
+        output_lines = tuple(self._reader.iter_lines(args))
+        self._cache[key] = (now, output_lines)
+        return output_lines
+
+    def _setup(self, args: List[str]) -> None:
+        output = self._reader.read(args)
+        self.invalidate_cache()
+        self._check_setup(output)
+
     @classmethod
     def _check_setup(cls, output: str):
         if not output.startswith("Setup configuration successful"):
@@ -0,0 +1,17 @@
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off", ""})
+
+
+def parse_bool_env_value(raw_value: str) -> bool:
+    """Parse a boolean environment variable value.
+    :param raw_value: "1", "true", "yes" or "on" for true, "0", "false", "no", "off" or "" for false (case
+                      insensitive, surrounding whitespace is ignored).
+    :return: The parsed value.
+    :raises: ValueError: If the value is not recognized.
+    """
+    value = raw_value.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"invalid boolean value: '{raw_value}'")
@@ -0,0 +1,15 @@
+import gc
+
+# Import the application once in the gunicorn master so that workers share its
+# memory pages (copy-on-write) instead of each importing it after the fork.
+preload_app = True
+
+
+def when_ready(server):
+    # Move preloaded objects out of the GC generations: a collection would
+    # otherwise touch (and un-share) every page holding them.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    gc.freeze()
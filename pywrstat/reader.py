@@ -1,23 +1,35 @@
 import abc
 import os
 from pathlib import Path
-from subprocess import PIPE, Popen
-from typing import List, Optional
+from subprocess import PIPE, STDOUT, Popen, run
+from typing import Dict, Iterator, List, Optional
 
 from pywrstat.constants import DEFAULT_PWRSTAT_PATH
+from pywrstat.env import parse_bool_env_value
 from pywrstat.errors import CommandFailed, MissingBinary
 
+_ENV_VAR_NAMES = ("PYWRSTAT_PWRSTAT_EXECUTABLE_PATH", "PYWRSTAT_RUN_PWRSTAT_WITH_SUDO")
+_env_cache: Dict[str, Optional[str]] = {}
+
+
+def refresh_env_cache() -> None:
+    """Re-read the pywrstat environment variables. They are read once when this module is imported, call this
+    function after changing them at runtime.
+    """
+    _env_cache.update((name, os.environ.get(name)) for name in _ENV_VAR_NAMES)
+
+
+refresh_env_cache()
+
 
 def _get_default_pwrstat_path() -> Path:
-    return Path(
-        os.environ.get("PYWRSTAT_PWRSTAT_EXECUTABLE_PATH", DEFAULT_PWRSTAT_PATH)
-    )
+    return Path(_env_cache["PYWRSTAT_PWRSTAT_EXECUTABLE_PATH"] or DEFAULT_PWRSTAT_PATH)
 
 
 def _get_run_with_sudo_by_default(user_preference: Optional[bool]) -> bool:
     if user_preference is not None:
         return user_preference
-    return bool(int(os.environ.get("PYWRSTAT_RUN_PWRSTAT_WITH_SUDO", False)))
+    return parse_bool_env_value(_env_cache["PYWRSTAT_RUN_PWRSTAT_WITH_SUDO"] or "0")
 
 
 class ReaderBase(abc.ABC):
@@ -25,6 +37,9 @@ class ReaderBase(abc.ABC):
     def read(self, args: List[str]) -> str:
         pass
 
+    def iter_lines(self, args: List[str]) -> Iterator[str]:
+        yield from self.read(args).splitlines(keepends=False)
+
 
 class Reader(ReaderBase):
     def __init__(
@@ -34,15 +49,33 @@ class Reader(ReaderBase):
         self._pwrstat_path = pwrstat_path or _get_default_pwrstat_path()
         if not self._pwrstat_path.is_file():
             raise MissingBinary(f"pwrstat is not installed at '{self._pwrstat_path}'")
+        sudo_prefix = ["sudo"] if self._sudo else []
+        self._command_prefix = sudo_prefix + [str(self._pwrstat_path)]
+
+    def _get_command(self, args: List[str]) -> List[str]:
+        return self._command_prefix + args
 
     def read(self, args: List[str]) -> str:
-        sudo_prefix = ["sudo"] if self._sudo else []
-        all_args = sudo_prefix + [str(self._pwrstat_path)] + args
-        with Popen(all_args, stdout=PIPE, stderr=PIPE) as s:
-            out, err = s.communicate()
-            full_output = out.decode().strip() + err.decode().strip()
-            if s.returncode != 0:
-                raise CommandFailed(
-                    f"Failed to run {all_args} (rc={s.returncode}). Full pwrstat output: {full_output}"
-                )
-            return full_output
+        all_args = self._get_command(args)
+        result = run(all_args, capture_output=True)
+        full_output = (result.stdout + result.stderr).decode().strip()
+        if result.returncode != 0:
+            raise CommandFailed(
+                f"Failed to run {all_args} (rc={result.returncode}). Full pwrstat output: {full_output}"
+            )
+        return full_output
+
+    def iter_lines(self, args: List[str]) -> Iterator[str]:
+        all_args = self._get_command(args)
+        output_lines = []
+        with Popen(all_args, stdout=PIPE, stderr=STDOUT, encoding="utf-8") as s:
+            assert s.stdout is not None
+            for line in s.stdout:
+                output_lines.append(line)
+                yield line.rstrip("\n")
+            returncode = s.wait()
+        if returncode != 0:
+            full_output = "".join(output_lines).strip()
+            raise CommandFailed(
+                f"Failed to run {all_args} (rc={returncode}). Full pwrstat output: {full_output}"
+            )
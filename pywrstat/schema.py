@@ -1,10 +1,10 @@
 import enum
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Literal, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
 from pydantic import BaseModel as _BaseModel
-from pydantic import ConfigDict
+from pydantic import ConfigDict, Field
 
 
 class BaseModel(_BaseModel):
@@ -86,7 +86,10 @@ class ReachabilityChangedEvent(BaseModel):
     reachable: bool
 
 
-EventType = Union[ValueChangedEvent, ReachabilityChangedEvent]
+EventType = Annotated[
+    Union[ValueChangedEvent, ReachabilityChangedEvent],
+    Field(discriminator="event_type"),
+]
 
 
 class Events(BaseModel):
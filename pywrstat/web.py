@@ -1,18 +1,28 @@
 import os
 from datetime import timedelta
-from functools import wraps
+from functools import cache, wraps
 from http import HTTPStatus
 from pathlib import Path
-from typing import Literal, Optional, cast
+from typing import Literal, Optional, Tuple, cast
 
 import jwt
 from flask import Flask, Response, abort, request
+from werkzeug.http import generate_etag
 
 from pywrstat.client import Pywrstat
+from pywrstat.env import parse_bool_env_value
 from pywrstat.reader import Reader
 from pywrstat.schema import BaseModel
 
 app = Flask(__name__)
+_JWT_ALGORITHMS = ["HS256"]
+UPS_PROPERTIES_MAX_AGE_SECONDS = 86400
+
+
+def _parse_cache_ttl_ms(raw_ttl_ms: Optional[str]) -> Optional[timedelta]:
+    if not raw_ttl_ms:
+        return None
+    return timedelta(milliseconds=float(raw_ttl_ms))
 
 
 class ServerConfig(BaseModel):
@@ -20,14 +30,20 @@ class ServerConfig(BaseModel):
     jwt_secret_key: Optional[str]
     sudo_pwrstat: bool
     pwrstat_path: Optional[Path]
+    reader_cache_ttl: Optional[timedelta] = None
 
     @staticmethod
     def from_env() -> "ServerConfig":
         return ServerConfig(
             secret_key=os.environ["PYWRSTAT_WEB_SECRET_KEY"],
             jwt_secret_key=os.getenv("PYWRSTAT_WEB_JWT_SECRET_KEY"),
-            sudo_pwrstat=os.getenv("PYWRSTAT_RUN_PWRSTAT_WITH_SUDO", True),
+            sudo_pwrstat=parse_bool_env_value(
+                os.getenv("PYWRSTAT_RUN_PWRSTAT_WITH_SUDO", "1")
+            ),
             pwrstat_path=os.getenv("PYWRSTAT_PWRSTAT_EXECUTABLE_PATH", None),
+            reader_cache_ttl=_parse_cache_ttl_ms(
+                os.getenv("PYWRSTAT_READER_CACHE_TTL_MS")
+            ),
         )
 
 
@@ -40,19 +56,25 @@ def get_server_config() -> ServerConfig:
     return cast(ServerConfig, app.config["server_config"])
 
 
+def pydantic_json_bytes(data: BaseModel) -> bytes:
+    # Serialize straight to utf-8 bytes (same output as model_dump_json)
+    return data.__pydantic_serializer__.to_json(data)
+
+
 def pydantic_json_response(data: BaseModel, status: int = 200):
     return app.response_class(
-        response=data.model_dump_json(), status=status, mimetype="application/json"
+        response=pydantic_json_bytes(data), status=status, mimetype="application/json"
     )
 
 
+@cache
 def get_pywrstat_client() -> Pywrstat:
     server_config = get_server_config()
     reader = Reader(
         run_with_sudo=server_config.sudo_pwrstat,
         pwrstat_path=server_config.pwrstat_path,
     )
-    return Pywrstat(reader)
+    return Pywrstat(reader, cache_ttl=server_config.reader_cache_ttl)
 
 
 def require_jwt(func):
@@ -60,9 +82,9 @@ def require_jwt(func):
     def impl(*args, **kwargs):
         if jwt_secret_key := get_server_config().jwt_secret_key:
             try:
-                _, jwt_token = request.headers["Authorization"].split(" ", maxsplit=1)
+                _, _, jwt_token = request.headers["Authorization"].partition(" ")
                 JwtPayload.model_validate(
-                    jwt.decode(jwt_token, jwt_secret_key, algorithms=["HS256"])
+                    jwt.decode(jwt_token, jwt_secret_key, algorithms=_JWT_ALGORITHMS)
                 )
             except Exception:
                 return abort(HTTPStatus.UNAUTHORIZED)
@@ -82,7 +104,7 @@ def get_ups_status():
 def monitor_ups_status() -> Response:
     def monitor(poll_every: timedelta):
         for event in get_pywrstat_client().monitor_ups_status(poll_every):
-            yield f"data: {event.model_dump_json()}\n\n"
+            yield b"data: " + pydantic_json_bytes(event) + b"\n\n"
 
     return app.response_class(
         response=monitor(
@@ -92,9 +114,23 @@ def monitor_ups_status() -> Response:
     )
 
 
+@cache
+def get_cached_ups_properties_json() -> Tuple[bytes, str]:
+    """Properties (model, firmware, ratings) are fixed for a given UPS: fetch and serialize them once.
+    Once cached, they are served even if the UPS becomes unreachable (until `create_app` is called again).
+    :return: The serialized properties and their ETag.
+    """
+    body = pydantic_json_bytes(get_pywrstat_client().get_ups_properties())
+    return body, generate_etag(body)
+
+
 @app.route("/pywrstat/ups/properties")
 def get_ups_properties() -> Response:
-    return pydantic_json_response(get_pywrstat_client().get_ups_properties())
+    body, etag = get_cached_ups_properties_json()
+    response = app.response_class(response=body, mimetype="application/json")
+    response.cache_control.max_age = UPS_PROPERTIES_MAX_AGE_SECONDS
+    response.set_etag(etag)
+    return response.make_conditional(request)
 
 
 @app.route("/pywrstat/daemon/configuration")
@@ -106,6 +142,8 @@ def create_app():
     server_config = ServerConfig.from_env()
     app.secret_key = server_config.secret_key
     app.config["server_config"] = server_config
+    get_pywrstat_client.cache_clear()
+    get_cached_ups_properties_json.cache_clear()
     return app
 
 
@@ -4,17 +4,16 @@ import pathlib
 import setuptools
 
 HERE = pathlib.Path(__file__).parent
-README = (HERE / "README.md").read_text()
 
 __version__ = "0.0.0"
-exec(open("pywrstat/version.py").read())  # export __version__
+exec((HERE / "pywrstat" / "version.py").read_text())  # export __version__
 
 
 setuptools.setup(
     name="pywrstat",
     version=__version__,
     description="Pwrstat (CyberPower UPS Linux command line) Python wrapper API",
-    long_description=README,
+    long_description=(HERE / "README.md").read_text(encoding="utf-8"),
     long_description_content_type="text/markdown",
     author="Jean-Edouard Boulanger",
     url="https://github.com/jean-edouard-boulanger/pywrstat",
@@ -35,11 +34,9 @@ setuptools.setup(
         "Topic :: System :: Power (UPS)",
     ],
     install_requires=[
-        "python-dateutil>=2.8.2,<3",
         "pydantic>=2.0.2,<3",
         "Flask>=2.3.2,<3",
         "gunicorn>=20.1.0,<21",
         "PyJWT>=2.7.0,<3",
-        "python-dotenv>=1.0.0,<2",
     ],
 )
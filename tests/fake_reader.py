@@ -1,12 +1,91 @@
+from collections import deque
 from dataclasses import dataclass
 from textwrap import dedent
-from typing import List, Optional
+from typing import Deque, List, Optional
 
 from pywrstat.client import _on_off
 from pywrstat.reader import ReaderBase
 
+# Output templates are dedented once, at import time (filled with %-formatting)
+_STATUS_UNREACHABLE_TEMPLATE = dedent(
+    """
+    The UPS information shows as following:
 
-@dataclass
+        Properties:
+            Model Name................... %(model_name)s
+            Firmware Number.............. %(firmware_number)s
+            Rating Voltage............... %(rating_voltage)s V
+            Rating Power................. %(rating_power)s Watt
+
+        Current UPS status:
+            State........................ Lost Communication
+            Test Result.................. %(ups_test_result)s
+            Last Power Event............. %(ups_last_power_event)s
+    """
+)
+_STATUS_TEMPLATE = dedent(
+    """
+    The UPS information shows as following:
+
+        Properties:
+            Model Name................... %(model_name)s
+            Firmware Number.............. %(firmware_number)s
+            Rating Voltage............... %(rating_voltage)s V
+            Rating Power................. %(rating_power)s Watt
+
+        Current UPS status:
+            State........................ %(ups_state)s
+            Power Supply by.............. %(ups_power_supply)s
+            Utility Voltage.............. %(ups_utility_voltage)s V
+            Output Voltage............... %(ups_output_voltage)s V
+            Battery Capacity............. %(ups_battery_capacity)s %%
+            Remaining Runtime............ %(ups_remaining_runtime)s min.
+            Load......................... %(ups_load_watts)s Watt(%(ups_load_percent)s %%)
+            Line Interaction............. %(ups_line_interaction)s
+            Test Result.................. %(ups_test_result)s
+            Last Power Event............. %(ups_last_power_event)s
+    """
+)
+_CONFIG_TEMPLATE = dedent(
+    """
+    Daemon Configuration:
+
+    Alarm .............................................. %(alarm_enabled)s
+    Hibernate .......................................... %(hibernate_enabled)s
+    Cloud .............................................. %(cloud_enabled)s
+
+    Action for Power Failure:
+
+        Delay time since Power failure ............. %(pf_action_delay_seconds)s sec.
+        Run script command ......................... %(pf_action_script_enabled)s
+        Path of script command ..................... %(pf_action_script_command_path)s
+        Duration of command running ................ %(pf_action_script_duration_seconds)s sec.
+        Enable shutdown system ..................... %(pf_action_system_shutdown_enabled)s
+
+    Action for Battery Low:
+
+        Remaining runtime threshold ................ %(bl_action_runtime_threshold_seconds)s sec.
+        Battery capacity threshold ................. %(bl_action_battery_capacity_threshold)s %%.
+        Run script command ......................... %(bl_action_script_enabled)s
+        Path of command ............................ %(bl_action_script_command_path)s
+        Duration of command running ................ %(bl_action_script_duration_seconds)s sec.
+        Enable shutdown system ..................... %(bl_action_system_shutdown_enabled)s
+    """
+)
+_VERSION_TEMPLATE = dedent(
+    """
+    version:
+    pwrstat version %(pwrstat_version)s
+    """
+)
+_TEST_OUTPUT = dedent(
+    """
+    The UPS test is initiated, checking the result by command "pwrstat -status".
+    """
+)
+
+
+@dataclass(frozen=True)
 class FakeCall:
     args: List[str]
     output: Optional[str]
@@ -19,7 +98,7 @@ class FakeCall:
 
 class FakeReader(ReaderBase):
     def __init__(self):
-        self._expected_calls: List[FakeCall] = []
+        self._expected_calls: Deque[FakeCall] = deque()
         self._previous_calls: List[FakeCall] = []
 
     def assert_no_more_calls(self):
@@ -30,7 +109,7 @@ class FakeReader(ReaderBase):
             f"FakeReader did not expect to be called any more, was called with"
             f" `{args}` instead (call number {len(self._previous_calls) + 1})"
         )
-        call = self._expected_calls.pop(0)
+        call = self._expected_calls.popleft()
         assert call.args == args, (
             f"FakeReader expected to be called with `{call.args}`, was called with"
             f" `{args}` instead (call number {len(self._previous_calls) + 1})"
@@ -53,21 +132,14 @@ class FakeReader(ReaderBase):
         self._expected_calls.append(
             FakeCall(
                 args=["-status"],
-                output=dedent(
-                    f"""
-                    The UPS information shows as following:
-    
-                        Properties:
-                            Model Name................... {model_name}
-                            Firmware Number.............. {firmware_number}
-                            Rating Voltage............... {rating_voltage} V
-                            Rating Power................. {rating_power} Watt
-    
-                        Current UPS status:
-                            State........................ Lost Communication
-                            Test Result.................. {ups_test_result}
-                            Last Power Event............. {ups_last_power_event}
-                    """
+                output=_STATUS_UNREACHABLE_TEMPLATE
+                % dict(
+                    model_name=model_name,
+                    firmware_number=firmware_number,
+                    rating_voltage=rating_voltage,
+                    rating_power=rating_power,
+                    ups_test_result=ups_test_result,
+                    ups_last_power_event=ups_last_power_event,
                 ),
                 raises=None,
             )
@@ -93,28 +165,23 @@ class FakeReader(ReaderBase):
         self._expected_calls.append(
             FakeCall(
                 args=["-status"],
-                output=dedent(
-                    f"""
-                    The UPS information shows as following:
-    
-                        Properties:
-                            Model Name................... {model_name}
-                            Firmware Number.............. {firmware_number}
-                            Rating Voltage............... {rating_voltage} V
-                            Rating Power................. {rating_power} Watt
-    
-                        Current UPS status:
-                            State........................ {ups_state}
-                            Power Supply by.............. {ups_power_supply}
-                            Utility Voltage.............. {ups_utility_voltage} V
-                            Output Voltage............... {ups_output_voltage} V
-                            Battery Capacity............. {ups_battery_capacity} %
-                            Remaining Runtime............ {ups_remaining_runtime} min.
-                            Load......................... {ups_load_watts} Watt({int((ups_load_watts / rating_power) * 100)} %)
-                            Line Interaction............. {ups_line_interaction}
-                            Test Result.................. {ups_test_result}
-                            Last Power Event............. {ups_last_power_event}
-                    """
+                output=_STATUS_TEMPLATE
+                % dict(
+                    model_name=model_name,
+                    firmware_number=firmware_number,
+                    rating_voltage=rating_voltage,
+                    rating_power=rating_power,
+                    ups_state=ups_state,
+                    ups_power_supply=ups_power_supply,
+                    ups_utility_voltage=ups_utility_voltage,
+                    ups_output_voltage=ups_output_voltage,
+                    ups_battery_capacity=ups_battery_capacity,
+                    ups_remaining_runtime=ups_remaining_runtime,
+                    ups_load_watts=ups_load_watts,
+                    ups_load_percent=(ups_load_watts * 100) // rating_power,
+                    ups_line_interaction=ups_line_interaction,
+                    ups_test_result=ups_test_result,
+                    ups_last_power_event=ups_last_power_event,
                 ),
                 raises=None,
             )
@@ -140,31 +207,30 @@ class FakeReader(ReaderBase):
         self._expected_calls.append(
             FakeCall(
                 args=["-config"],
-                output=dedent(
-                    f"""
-                    Daemon Configuration:
-                    
-                    Alarm .............................................. {_on_off(alarm_enabled).capitalize()}
-                    Hibernate .......................................... {_on_off(hibernate_enabled).capitalize()}
-                    Cloud .............................................. {_on_off(cloud_enabled).capitalize()}
-                    
-                    Action for Power Failure:
-                    
-                        Delay time since Power failure ............. {pf_action_delay_seconds} sec.
-                        Run script command ......................... {_on_off(pf_action_script_enabled).capitalize()}
-                        Path of script command ..................... {pf_action_script_command_path}
-                        Duration of command running ................ {pf_action_script_duration_seconds} sec.
-                        Enable shutdown system ..................... {_on_off(pf_action_system_shutdown_enabled).capitalize()}
-                    
-                    Action for Battery Low:
-                    
-                        Remaining runtime threshold ................ {bl_action_runtime_threshold_seconds} sec.
-                        Battery capacity threshold ................. {bl_action_battery_capacity_threshold} %.
-                        Run script command ......................... {_on_off(bl_action_script_enabled).capitalize()}
-                        Path of command ............................ {bl_action_script_command_path}
-                        Duration of command running ................ {bl_action_script_duration_seconds} sec.
-                        Enable shutdown system ..................... {_on_off(bl_action_system_shutdown_enabled).capitalize()}
-                    """
+                output=_CONFIG_TEMPLATE
+                % dict(
+                    alarm_enabled=_on_off(alarm_enabled).capitalize(),
+                    hibernate_enabled=_on_off(hibernate_enabled).capitalize(),
+                    cloud_enabled=_on_off(cloud_enabled).capitalize(),
+                    pf_action_delay_seconds=pf_action_delay_seconds,
+                    pf_action_script_enabled=_on_off(
+                        pf_action_script_enabled
+                    ).capitalize(),
+                    pf_action_script_command_path=pf_action_script_command_path,
+                    pf_action_script_duration_seconds=pf_action_script_duration_seconds,
+                    pf_action_system_shutdown_enabled=_on_off(
+                        pf_action_system_shutdown_enabled
+                    ).capitalize(),
+                    bl_action_runtime_threshold_seconds=bl_action_runtime_threshold_seconds,
+                    bl_action_battery_capacity_threshold=bl_action_battery_capacity_threshold,
+                    bl_action_script_enabled=_on_off(
+                        bl_action_script_enabled
+                    ).capitalize(),
+                    bl_action_script_command_path=bl_action_script_command_path,
+                    bl_action_script_duration_seconds=bl_action_script_duration_seconds,
+                    bl_action_system_shutdown_enabled=_on_off(
+                        bl_action_system_shutdown_enabled
+                    ).capitalize(),
                 ),
                 raises=None,
             )
@@ -174,27 +240,14 @@ class FakeReader(ReaderBase):
         self._expected_calls.append(
             FakeCall(
                 args=["-version"],
-                output=dedent(
-                    f"""
-                    version:
-                    pwrstat version {pwrstat_version}
-                    """
-                ),
+                output=_VERSION_TEMPLATE % dict(pwrstat_version=pwrstat_version),
                 raises=None,
             )
         )
 
     def expect_test_call(self):
         self._expected_calls.append(
-            FakeCall(
-                args=["-test"],
-                output=dedent(
-                    """
-                    The UPS test is initiated, checking the result by command "pwrstat -status".
-                    """
-                ),
-                raises=None,
-            )
+            FakeCall(args=["-test"], output=_TEST_OUTPUT, raises=None)
         )
 
     def expect_call(
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pytest
+
+from pywrstat import cli
+
+
+def test_read_env_vars_round_trips_env_file_template(tmp_path: Path):
+    env_file_path = tmp_path / "pywrstat_web.env"
+    env_file_path.write_text(
+        cli.WEB_SERVICE_ENV_FILE_TEMPLATE.format(
+            secret_key="secret",
+            jwt_secret_key="jwt=secret",
+            pwrstat_path="/usr/sbin/pwrstat",
+            sudo_pwrstat=1,
+        )
+    )
+    assert cli._read_env_vars(env_file_path) == {
+        "PYWRSTAT_WEB_SECRET_KEY": "secret",
+        "PYWRSTAT_WEB_JWT_SECRET_KEY": "jwt=secret",
+        "PYWRSTAT_PWRSTAT_EXECUTABLE_PATH": "/usr/sbin/pwrstat",
+        "PYWRSTAT_RUN_PWRSTAT_WITH_SUDO": "1",
+    }
+
+
+def test_get_server_keys(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    env_file_path = tmp_path / "pywrstat_web.env"
+    env_file_path.write_text(
+        'PYWRSTAT_WEB_SECRET_KEY="secret"\nPYWRSTAT_WEB_JWT_SECRET_KEY="jwt"\n'
+    )
+    monkeypatch.setattr(cli, "PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH", env_file_path)
+    assert cli.get_server_keys() == ("secret", "jwt")
+
+
+def test_get_server_keys_missing_env_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        cli, "PYWRSTAT_WEB_SERVICE_ENV_FILE_PATH", tmp_path / "missing.env"
+    )
+    assert cli.get_server_keys() == (None, None)
+
+
+@pytest.mark.parametrize("mode", [None, "-h", "web.systemctl.instal"])
+def test_create_argument_parser_keeps_install_arguments(mode):
+    parser = cli.create_argument_parser(mode=mode)
+    args = parser.parse_args(["web.systemctl.install", "--bind", ":9000"])
+    assert args.bind == ("0.0.0.0", 9000)
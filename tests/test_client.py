@@ -15,6 +15,8 @@ from pywrstat import (
     Pywrstat,
     TestResult,
     TestStatus,
+    Timeout,
+    Unreachable,
     UPSProperties,
     UPSStatus,
 )
@@ -29,6 +31,7 @@ from pywrstat.client import (
     _parse_pwrstat_output,
     _parse_test_result,
 )
+from pywrstat.env import parse_bool_env_value
 
 from .conftest import does_not_raise, pretty_dump
 from .fake_reader import FakeReader
@@ -83,6 +86,12 @@ def test_parse_load_percent():
     assert _parse_load_percent("27 Watt(3 %)") == 0.03
 
 
+@pytest.mark.parametrize("raw_load", ["27 Watt", "27 Watt(abc %)", ""])
+def test_parse_load_percent_invalid(raw_load: str):
+    with pytest.raises(ValueError):
+        _parse_load_percent(raw_load)
+
+
 @pytest.mark.parametrize(
     "raw_test_result, expected_test_result",
     [
@@ -165,11 +174,14 @@ def test_is_ups_reachable(state: str, expected_reachable: bool):
         (0.0, does_not_raise()),
         (0.5, does_not_raise()),
         (1.0, does_not_raise()),
-        (0, pytest.raises(ValueError)),
-        (1, pytest.raises(ValueError)),
+        (0, does_not_raise()),
+        (1, does_not_raise()),
         (-1.0, pytest.raises(ValueError)),
+        (float("nan"), pytest.raises(ValueError)),
         (100, pytest.raises(ValueError)),
         (50.0, pytest.raises(ValueError)),
+        (True, pytest.raises(ValueError)),
+        ("0.5", pytest.raises(ValueError)),
     ],
 )
 def test_check_percent(percent_value, expectation):
@@ -189,10 +201,39 @@ def test_check_percent(percent_value, expectation):
         ("OFF", False),
     ],
 )
-def _test_parse_on_off(raw_on_off: str, expected_enabled: bool):
+def test_parse_on_off(raw_on_off: str, expected_enabled: bool):
     assert _parse_on_off(raw_on_off) is expected_enabled
 
 
+def test_parse_on_off_invalid():
+    with pytest.raises(KeyError):
+        _parse_on_off("maybe")
+
+
+@pytest.mark.parametrize(
+    "raw_value,expected",
+    [
+        ("1", True),
+        ("true", True),
+        (" Yes ", True),
+        ("ON", True),
+        ("0", False),
+        ("false", False),
+        (" No ", False),
+        ("OFF", False),
+        ("", False),
+    ],
+)
+def test_parse_bool_env_value(raw_value: str, expected: bool):
+    assert parse_bool_env_value(raw_value) is expected
+
+
+@pytest.mark.parametrize("raw_value", ["2", "ture", "enabled"])
+def test_parse_bool_env_value_invalid(raw_value: str):
+    with pytest.raises(ValueError):
+        parse_bool_env_value(raw_value)
+
+
 def test_parse_power_failure_action():
     data = {
         "Delay time since Power failure": "600 sec.",
@@ -427,6 +468,28 @@ def test_get_ups_properties(pywrstat_client: Pywrstat, reader_mock: FakeReader):
     reader_mock.assert_no_more_calls()
 
 
+def test_get_ups_snapshot(pywrstat_client: Pywrstat, reader_mock: FakeReader):
+    reader_mock.expect_status_call(ups_state="On Battery")
+    status, properties = pywrstat_client.get_ups_snapshot()
+    assert status.state == "On Battery"
+    assert properties == UPSProperties(
+        ups_model_name="CP1500EPFCLCD",
+        firmware_number="CR0XXXXXXX",
+        rating_voltage_volts=230,
+        rating_power_watts=900,
+    )
+    reader_mock.assert_no_more_calls()
+
+
+def test_get_ups_snapshot_when_unreachable(
+    pywrstat_client: Pywrstat, reader_mock: FakeReader
+):
+    reader_mock.expect_status_call_unreachable()
+    with pytest.raises(Unreachable):
+        pywrstat_client.get_ups_snapshot()
+    reader_mock.assert_no_more_calls()
+
+
 @pytest.mark.parametrize(
     "previous_test_result, final_test_result",
     [
@@ -459,6 +522,29 @@ def test_test_ups_with_poll(
     sleep_mock.assert_has_calls([call(5.0), call(5.0), call(5.0), call(5.0)])
 
 
+@patch("pywrstat.client.time")
+def test_test_ups_raises_on_timeout(
+    time_mock, pywrstat_client: Pywrstat, reader_mock: FakeReader
+):
+    # Fake clock, only advanced by sleep
+    clock = {"now": 0.0}
+    time_mock.monotonic.side_effect = lambda: clock["now"]
+    time_mock.sleep.side_effect = lambda seconds: clock.update(
+        now=clock["now"] + seconds
+    )
+    reader_mock.expect_status_call(ups_test_result="None")
+    reader_mock.expect_test_call()
+    for _ in range(4):
+        reader_mock.expect_status_call(ups_test_result="In progress")
+    with pytest.raises(Timeout):
+        pywrstat_client.test_ups(
+            timeout=timedelta(seconds=5), poll_every=timedelta(seconds=2)
+        )
+    reader_mock.assert_no_more_calls()
+    time_mock.sleep.assert_has_calls([call(2.0), call(2.0), call(2.0)])
+    assert time_mock.sleep.call_count == 3
+
+
 def test_test_ups_raises_if_test_already_in_progress(
     pywrstat_client: Pywrstat, reader_mock: FakeReader
 ):
@@ -589,3 +675,25 @@ def test_configure_cloud(pywrstat_client: Pywrstat, reader_mock: FakeReader):
     )
     pywrstat_client.configure_cloud(enabled=True, account="dummy", password="123456"),
     reader_mock.assert_no_more_calls()
+
+
+def test_cache_ttl_reuses_pwrstat_output(reader_mock: FakeReader):
+    pywrstat_client = Pywrstat(reader=reader_mock, cache_ttl=timedelta(minutes=1))
+    reader_mock.expect_config_call(alarm_enabled=True)
+    reader_mock.expect_status_call()
+    assert pywrstat_client.alarm_enabled
+    assert pywrstat_client.get_daemon_configuration().alarm_enabled
+    assert pywrstat_client.is_reachable()
+    assert pywrstat_client.get_ups_properties().ups_model_name == "CP1500EPFCLCD"
+    reader_mock.assert_no_more_calls()
+
+
+def test_cache_invalidated_after_setup(reader_mock: FakeReader):
+    pywrstat_client = Pywrstat(reader=reader_mock, cache_ttl=timedelta(minutes=1))
+    reader_mock.expect_config_call(alarm_enabled=True)
+    reader_mock.expect_call(["-alarm", "off"], "Setup configuration successful.")
+    reader_mock.expect_config_call(alarm_enabled=False)
+    assert pywrstat_client.alarm_enabled
+    pywrstat_client.alarm_enabled = False
+    assert not pywrstat_client.alarm_enabled
+    reader_mock.assert_no_more_calls()
@@ -0,0 +1,13 @@
+import pywrstat
+from pywrstat.client import Pywrstat
+
+
+def test_lazy_attribute_access():
+    assert pywrstat.Pywrstat is Pywrstat
+    names = dir(pywrstat)
+    assert len(names) == len(set(names))
+    assert set(pywrstat.__all__) <= set(names)
+
+
+def test_all_matches_lazy_exports():
+    assert set(pywrstat.__all__) == set(pywrstat._ATTR_TO_MODULE)
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+
+from pywrstat import CommandFailed
+from pywrstat.reader import Reader
+
+
+def make_reader(tmp_path: Path, script: str) -> Reader:
+    pwrstat_path = tmp_path / "pwrstat"
+    pwrstat_path.write_text(f"#!/bin/sh\n{script}\n")
+    pwrstat_path.chmod(0o755)
+    return Reader(pwrstat_path=pwrstat_path, run_with_sudo=False)
+
+
+def test_iter_lines(tmp_path: Path):
+    reader = make_reader(tmp_path, 'echo "first $1"; echo; echo "  last"')
+    assert list(reader.iter_lines(["-status"])) == ["first -status", "", "  last"]
+
+
+def test_iter_lines_merges_stderr(tmp_path: Path):
+    reader = make_reader(tmp_path, "echo out; echo err >&2")
+    assert sorted(reader.iter_lines(["-status"])) == ["err", "out"]
+
+
+def test_iter_lines_raises_after_output_on_failure(tmp_path: Path):
+    reader = make_reader(tmp_path, "echo partial; exit 3")
+    lines = reader.iter_lines(["-status"])
+    assert next(lines) == "partial"
+    with pytest.raises(CommandFailed, match=r"rc=3.*partial"):
+        next(lines)
+
+
+def test_read(tmp_path: Path):
+    reader = make_reader(tmp_path, 'echo "version:"; echo "pwrstat version 1.4.1"')
+    assert reader.read(["-version"]) == "version:\npwrstat version 1.4.1"
+
+
+def test_read_raises_on_failure(tmp_path: Path):
+    reader = make_reader(tmp_path, "echo broken >&2; exit 1")
+    with pytest.raises(CommandFailed, match=r"rc=1.*broken"):
+        reader.read(["-status"])